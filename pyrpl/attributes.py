@@ -666,6 +666,27 @@ class FrequencyRegister(FloatRegister, FrequencyProperty):
         return FrequencyProperty.validate_and_normalize(self, obj,
                         FloatRegister.validate_and_normalize(self, obj, value))
 
+    def validate_and_normalize_array(self, obj, values):
+        """
+        Same as validate_and_normalize, but for a whole numpy array of
+        frequencies at once.
+        """
+        values = np.rint(np.asarray(values, dtype=float) / self.increment) \
+                 * self.increment
+        return np.clip(values, self.min, self.max)
+
+    def applied_values(self, obj, values):
+        """
+        Returns the frequencies that are actually applied (i.e. that would be
+        read back from the register) when the numpy array values is written
+        to the register one by one, including the clock frequency correction.
+        """
+        values = np.abs(self.validate_and_normalize_array(obj, values)
+                        / obj._frequency_correction)
+        words = np.where(values == epsilon, 1,
+                         np.rint(values / self.CLOCK_FREQUENCY * 2 ** self.bits))
+        return 125e6 / 2 ** self.bits * words * obj._frequency_correction
+
 
 class PhaseProperty(FloatProperty):
     """
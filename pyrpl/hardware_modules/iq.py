@@ -191,6 +191,7 @@ reasonable frequency lock).
 """
 import sys
 from time import sleep
+from timeit import default_timer
 from collections import OrderedDict
 import numpy as np
 
@@ -198,7 +199,8 @@ from ..attributes import BoolRegister, FloatRegister, SelectRegister, \
     IntRegister, PhaseRegister, FrequencyRegister, FloatProperty, \
     FilterRegister, FilterProperty, GainRegister
 from ..widgets.module_widgets import IqWidget
-from ..pyrpl_utils import sorted_dict
+from ..pyrpl_utils import sorted_dict, geometric_sweep
+from ..errors import NotReadyError
 
 from . import FilterModule
 
@@ -412,15 +414,36 @@ class Iq(FilterModule):
     @property
     def _nadata_total(self): #only one read operation--> twice faster than _nadata
         attempt = 0
+        t_start = default_timer()
+        while True:
+            try:
+                return self._get_nadata_total()
+            except NotReadyError:
+                self._logger.warning('NA data not ready yet. Try again!')
+                attempt += 1
+                if attempt > 10:
+                    raise self._nadata_timeout_error(default_timer() - t_start)
+
+    def _nadata_timeout_error(self, waited):
+        """
+        Returns the error to raise when the NA data is still not ready after
+        waiting for the given time in seconds.
+        """
+        return NotReadyError("NA averaging still not finished after %.1f ms "
+                             "of waiting. Some setting is wrong."
+                             % (waited * 1000))
+
+    def _get_nadata_total(self):
+        """
+        Returns the sum of the na data in a single read operation.
+
+        Raises NotReadyError if the fpga has not finished averaging the
+        current point yet (the msb of each register is the averaging flag).
+        """
         a, b, c, d = self._reads(0x140, 4)
-        while not ((a >> 31 == 0) and (b >> 31 == 0)
-                   and (c >> 31 == 0) and (d >> 31 == 0)):
-            a, b, c, d = self._reads(0x140, 4)
-
-            self._logger.warning('NA data not ready yet. Try again!')
-            attempt += 1
-            if attempt > 10:
-                raise Exception("Trying to recover NA data while averaging is not finished. Some setting is wrong. ")
+        if not ((a >> 31 == 0) and (b >> 31 == 0)
+                and (c >> 31 == 0) and (d >> 31 == 0)):
+            raise NotReadyError("NA averaging is not finished yet.")
         sum = np.complex128(self._to_pyint(int(a) + (int(b) << 31), bitlength=62)) \
               + np.complex128(self._to_pyint(int(c) + (int(d) << 31), bitlength=62)) * 1j
         return sum
@@ -449,15 +472,12 @@ class Iq(FilterModule):
         #                 "future. Start using the module RedPitaya.na "
         #                 "instead!")
         if logscale:
-            x = np.logspace(
-                np.log10(start),
-                np.log10(stop),
-                points,
-                endpoint=True)
+            x = geometric_sweep(start, stop, points)
         else:
             x = np.linspace(start, stop, points, endpoint=True)
-        y = np.zeros(points, dtype=np.complex128)
-        amplitudes = np.zeros(points, dtype=np.float64)
+        # every element is written during the sweep, no need to zero them
+        y = np.empty(points, dtype=np.complex128)
+        amplitudes = np.empty(points, dtype=np.float64)
         # preventive saturation
         maxamplitude = abs(maxamplitude)
         amplitude = abs(amplitude)
@@ -477,31 +497,66 @@ class Iq(FilterModule):
         self._logger.info("Estimated acquisition time: %.1f s", float(avg + sleeptimes) * points / rbw)
         sys.stdout.flush()  # make sure the time is shown
         # setup averaging
-        self._na_averages = np.int(np.round(125e6 / rbw * avg))
-        self._na_sleepcycles = np.int(np.round(125e6 / rbw * sleeptimes))
+        cycles_per_rbw = 125e6 / rbw
+        na_averages = int(round(cycles_per_rbw * avg))
+        na_sleepcycles = int(round(cycles_per_rbw * sleeptimes))
+        self._na_averages = na_averages
+        self._na_sleepcycles = na_sleepcycles
+        # waiting time per point, computed once outside of the loop from
+        # the cycle counts. The fpga finishes averaging after this time.
+        time_per_point = float(na_sleepcycles + na_averages) \
+                         / (125e6 * self._frequency_correction)
+        # give up waiting for a point after a few times its duration (but
+        # leave at least 100 ms for the communication latency)
+        na_timeout = max(3 * time_per_point, 0.1)
+        # compute the frequencies that the register will apply, such that
+        # they need not be read back at every point
+        x = self.__class__.frequency.applied_values(self, x)
         # compute rescaling factor
         rescale = 2.0 ** (-self._LPFBITS) * 4.0  # 4 is artefact of fpga code
         # obtained by measuring transfer function with bnc cable - could replace the inverse of 4 above
         # unityfactor = 0.23094044589192711
+        # bind methods used at every point to local names
+        get_nadata_total = self._get_nadata_total
         try:
             self.amplitude = amplitude  # turn on NA inside try..except block
+            last_amplitude = amplitude
+            # discretized amplitude on the fpga, only read back upon change
+            current_amplitude = self.amplitude
             for i in range(points):
+                t_point = default_timer()
                 self.frequency = x[i]  # this triggers the NA acquisition
-                sleep(1.0 / rbw * (avg + sleeptimes))
-                x[i] = self.frequency  # get the actual (discretized) frequency
-                y[i] = self._nadata
-                amplitudes[i] = self.amplitude
-                # normalize immediately
-                if amplitudes[i] == 0:
-                    y[i] *= rescale  # avoid division by zero
-                else:
-                    y[i] *= rescale / self.amplitude
+                # the duration of the register write counts towards the wait
+                sleep(max(0, time_per_point - (default_timer() - t_point)))
+                while True:
+                    try:
+                        y_raw = get_nadata_total() / na_averages
+                    except NotReadyError:
+                        # fallback in case the point is late
+                        waited = default_timer() - t_point
+                        if waited > na_timeout:
+                            raise self._nadata_timeout_error(waited)
+                        sleep(1e-4)
+                    else:
+                        break
+                # y is normalized in a single pass after the loop
+                y[i] = y_raw
+                amplitudes[i] = current_amplitude
                 # set next amplitude if it has to change
                 if stabilize is not None:
-                    amplitude = stabilize / np.abs(y[i])
-                if amplitude > maxamplitude:
-                    amplitude = maxamplitude
-                self.amplitude = amplitude
+                    # scalar abs is much faster than np.abs for one value
+                    if current_amplitude == 0:
+                        amplitude = stabilize / abs(y_raw * rescale)
+                    else:
+                        amplitude = stabilize / abs(
+                            y_raw * rescale / current_amplitude)
+                    if amplitude > maxamplitude:
+                        amplitude = maxamplitude
+                # avoid a register write if nothing changes
+                if amplitude != last_amplitude:
+                    self.amplitude = amplitude
+                    last_amplitude = amplitude
+                    current_amplitude = self.amplitude
         # turn off the NA output, even in the case of exception (e.g. KeyboardInterrupt)
         except:
             self.amplitude = 0
@@ -509,6 +564,8 @@ class Iq(FilterModule):
             raise
         else:
             self.amplitude = 0
+        # normalize all points at once (avoid division by zero)
+        y *= rescale / np.where(amplitudes == 0, 1.0, amplitudes)
         # in zero-span mode, change x-axis to approximate time. Time is very
         # rudely approximated here..
         if start == stop:
@@ -3,6 +3,7 @@ from timeit import default_timer
 import logging
 logger = logging.getLogger(__file__)
 from collections import OrderedDict, Counter
+import numpy as np
 
 
 def isnotebook():
@@ -24,6 +25,24 @@ def time():
     """ returns the time. used instead of time.time for rapid portability"""
     return default_timer()
 
+def geometric_sweep(start, stop, points):
+    """
+    returns an array of points logarithmically spaced values from start to
+    stop (both included, like np.logspace), computed by multiplication with
+    a constant ratio instead of one power per point
+    """
+    if start <= 0 or stop <= 0:
+        raise ValueError("Logarithmic sweeps require positive start and stop "
+                         "values, got %s and %s." % (start, stop))
+    values = np.empty(points)
+    if points > 0:
+        values[0] = start
+    if points > 1:
+        values[1:] = (float(stop) / start) ** (1.0 / (points - 1))
+        values = np.cumprod(values)
+        values[-1] = stop  # exact endpoint
+    return values
+
 def get_unique_name_list_from_class_list(cls_list):
     """
     returns a list of names using cls.name if unique or cls.name1, cls.name2... otherwise.
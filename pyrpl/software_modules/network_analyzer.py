@@ -13,6 +13,8 @@ from ..modules import SignalModule
 from ..acquisition_module import AcquisitionModule
 from ..widgets.module_widgets import NaWidget
 from ..hardware_modules.iq import Iq
+from ..errors import NotReadyError
+from ..pyrpl_utils import geometric_sweep
 
 # timeit.default_timer() is THE precise timer to use (microsecond precise vs
 # milliseconds for time.time()). see
@@ -50,9 +52,9 @@ class RbwAttribute(FilterProperty):
         return instance.iq.bandwidth[0]
 
     def set_value(self, instance, val):
-        try:
+        if isinstance(val, (list, tuple, np.ndarray)):
             val = list(val)
-        except:
+        else:
             val = [val, val]  # preferentially choose second order filter
         instance.iq.bandwidth = val
         return val
@@ -95,7 +97,12 @@ class NaPointFuture(PyrplFuture):
 
     def _set_data_as_result(self):
         if not self.done(): # if point was cancelled, leave the loop.
-            point = self._module._get_point(self.point_index)
+            try:
+                point = self._module._get_point(self.point_index)
+            except NotReadyError as e:
+                # exceptions in this timer slot would not reach the future
+                self.set_exception(e)
+                return
             if point is not None:
                 self.set_result(point)
             else:
@@ -140,8 +147,8 @@ class NaCurveFuture(PyrplFuture):
     def start(self):
         # self._module.iq.output_direct = self._module.output_direct
         self._time_first_point = timeit.default_timer()
+        # _start_acquisition also sets the iq amplitude (via iq.setup)
         self._module._start_acquisition()
-        self._module.iq.amplitude = self._module.amplitude
         if self.never_started:
             self._module._emit_signal_by_name("clear_curve")
             self.never_started = False
@@ -181,6 +188,11 @@ class NaCurveFuture(PyrplFuture):
         except CancelledError:
             self._point_cancelled()
             return #  exit the loop (could be restarted latter for RunFuture)
+        except NotReadyError as e:
+            # the point timed out: stop and pass the error to the waiting code
+            self.pause()
+            self.set_exception(e)
+            return
         self._add_point(point)
 
         # if zero span mode, data_x is time measured, not frequency
@@ -359,12 +371,14 @@ class NetworkAnalyzer(AcquisitionModule, SignalModule):
         """
         underlying iq module.
         """
-        if not hasattr(self, '_iq'):
+        try:
+            return self._iq
+        except AttributeError:
             self._iq = self.pyrpl.iqs.pop(owner=self.name)
             # initialize iq options
-            self.iq.bandwidth = [self.__class__.rbw.default, self.__class__.rbw.default]
-            self.iq.inputfilter = -self.__class__.acbandwidth.default
-        return self._iq
+            self._iq.bandwidth = [self.__class__.rbw.default, self.__class__.rbw.default]
+            self._iq.inputfilter = -self.__class__.acbandwidth.default
+            return self._iq
 
     @property
     def output_directs(self):
@@ -501,7 +515,12 @@ class NetworkAnalyzer(AcquisitionModule, SignalModule):
         else:
             # normal frequency sweep, get frequency from data_x-array
             frequency = self._data_x[index]
-        self.iq.frequency = frequency
+        # The iq block of the current bitstream has no sweep table: each
+        # point is started by a write to its frequency register, which
+        # resets the averaging state machine. A batched sweep therefore
+        # requires fpga support and cannot be done from python alone.
+        # self._iq exists since _start_acquisition was called before
+        self._iq.frequency = frequency
         self._time_last_point = timeit.default_timer()
         # regular print output for travis workaround
         #self._logger.debug("Acquiring first NA point at frequency %.1f Hz..", frequency)
@@ -522,22 +541,24 @@ class NetworkAnalyzer(AcquisitionModule, SignalModule):
     def _get_point(self, index):
         # get the actual point's (discretized)
         # frequency
-        if self._remaining_time()>0:
+        if self._remaining_time() > 0:
             return None
         # only one read operation per point
-        y = self.iq._nadata_total / self._cached_na_averages
-
-        x = self._data_x[index]
-        tf = self._tf_values[index]
+        try:
+            y = self._read_nadata_total() / self._cached_na_averages
+        except NotReadyError:
+            # the fpga timing is exact, so this is only a fallback in case
+            # the point is late
+            if self._remaining_time() < -self._na_timeout:
+                raise self._iq._nadata_timeout_error(
+                    timeit.default_timer() - self._time_last_point)
+            return None
 
-        amp = self.amplitude  # get amplitude for normalization
-        if amp == 0:  # normalize immediately
-            y *= self._rescale  # avoid division by zero
-        else:
-            y *= self._rescale / amp
-        # correct for network analyzer transfer function (AC-filter and
-        # delay)
-        y /= tf
+        # normalize immediately and correct for network analyzer transfer
+        # function (AC-filter and delay) with the factor precomputed in
+        # _start_acquisition
+        y *= self._point_normalization[index]
+        amp = self._cached_amplitude
         return y, amp
 
     def take_ringdown(self, frequency, rbw=1000, points=1000, trace_average=1):
@@ -575,22 +596,40 @@ class NetworkAnalyzer(AcquisitionModule, SignalModule):
                       output_direct=self.output_direct,
                       output_signal='output_direct')
 
+        # read the discretized rbw only once (register read)
+        rbw = self.rbw
         # setup averaging
-        self.iq._na_averages = np.int(np.round(125e6 / self.rbw *
-                                               self.average_per_point))
+        cycles_per_rbw = 125e6 / rbw
+        self.iq._na_averages = int(round(cycles_per_rbw *
+                                         self.average_per_point))
         self._cached_na_averages = self.iq._na_averages
-        self.iq._na_sleepcycles = np.int(
-            np.round(125e6 / self.rbw * self.sleeptimes))
+        # bind the data readout of the iq module once for all points
+        self._read_nadata_total = self.iq._get_nadata_total
+        self.iq._na_sleepcycles = int(round(cycles_per_rbw * self.sleeptimes))
         # time_per_point is calculated at setup for speed reasons
         self.time_per_point = self._time_per_point()
+        # give up waiting for a point after a few times its duration (but
+        # leave at least 100 ms for the communication latency)
+        self._na_timeout = max(3 * self.time_per_point, 0.1)
         # compute rescaling factor of raw data
         # 4 is artefact of fpga code
         self._rescale = 2.0 ** (-self.iq._LPFBITS) * 4.0
+        # amplitude normalization is constant during a scan, since changing
+        # the amplitude calls setup(). Cache it to save work at every point.
+        amp = self.amplitude
+        if amp == 0:
+            self._point_rescale = self._rescale  # avoid division by zero
+        else:
+            self._point_rescale = self._rescale / amp
+        self._cached_amplitude = amp
         # to avoid reading it at every single point
         self.iq.frequency = x[0]  # this triggers the NA acquisition
         self._time_last_point = timeit.default_timer()
         # pre-calculate transfer_function values for speed
         self._tf_values = self.transfer_function(x)
+        # combine rescaling and transfer function correction into a single
+        # factor per point, computed for all points at once
+        self._point_normalization = self._point_rescale / self._tf_values
         self.iq.on = True
         # Warn the user if time_per_point is too small:
         # < 1 ms measurement time will make acquisition inefficient.
@@ -631,20 +670,17 @@ class NetworkAnalyzer(AcquisitionModule, SignalModule):
             return
 
         if self.logscale:
-            raw_values = np.logspace(
-                np.log10(self.start_freq),
-                np.log10(self.stop_freq),
-                         self.points,
-                         endpoint=True)
+            raw_values = geometric_sweep(self.start_freq,
+                                         self.stop_freq,
+                                         self.points)
         else:
             raw_values = np.linspace(self.start_freq,
                                self.stop_freq,
                                self.points,
                                endpoint=True)
-        values = np.zeros(len(raw_values))
-        for index, val in enumerate(raw_values):
-            values[index] = self.iq.__class__.frequency. \
-                validate_and_normalize(self, val)  # retrieve the real freqs...
+        # retrieve the real freqs, for all points at once
+        values = self.iq.__class__.frequency.validate_and_normalize_array(
+            self, raw_values)
         self._data_x = values
 
     def _remaining_time(self):
@@ -7,6 +7,7 @@ from .test_base import TestPyrpl
 import numpy as np
 from .. import global_config
 from ..async_utils import sleep as async_sleep
+from ..pyrpl_utils import geometric_sweep
 try:
     raise  # disables sound output during this test
     from pysine import sine
@@ -256,6 +257,51 @@ class TestNA(TestPyrpl):
             assert len(curve.data[1]) == self.na.points
             self.curves.append(curve)  # curve will be deleted by teardownAll
 
+    def test_data_x_discretization(self):
+        """
+        data_x must be identical to the values from validate_and_normalize
+        of the iq frequency register
+        """
+        with self.pyrpl.networkanalyzer as self.na:
+            frequency = self.na.iq.__class__.frequency
+            for start, stop in [(1e3, 1e6), (1e6, 1e3), (1e5, 70e6)]:
+                self.na.setup(start_freq=start,
+                              stop_freq=stop,
+                              points=1001,
+                              logscale=False,
+                              running_state='stopped')
+                raw = np.linspace(start, stop, 1001, endpoint=True)
+                expected = [frequency.validate_and_normalize(self.na, v)
+                            for v in raw]
+                assert (self.na.data_x == expected).all(), (start, stop)
+            for start, stop, points in [(1e3, 1e6, 1001),
+                                        (1e6, 1e3, 1001),
+                                        (1e3, 1e6, 2),
+                                        (1e3, 1e6, 1)]:
+                self.na.setup(start_freq=start,
+                              stop_freq=stop,
+                              points=points,
+                              logscale=True,
+                              running_state='stopped')
+                raw = geometric_sweep(start, stop, points)
+                expected = [frequency.validate_and_normalize(self.na, v)
+                            for v in raw]
+                assert (self.na.data_x == expected).all(), (start, stop)
+
+    def test_geometric_sweep(self):
+        for start, stop, points in [(1e3, 1e6, 1001),
+                                    (1e6, 1e3, 1001),
+                                    (1e3, 1e6, 2),
+                                    (1e3, 1e6, 1)]:
+            values = geometric_sweep(start, stop, points)
+            expected = np.logspace(np.log10(start), np.log10(stop), points,
+                                   endpoint=True)
+            assert len(values) == points
+            assert values[0] == start
+            if points > 1:
+                assert values[-1] == stop
+            assert np.allclose(values, expected, rtol=1e-9, atol=0)
+
     def test_iq_stopped_after_run(self):
         with self.pyrpl.networkanalyzer as self.na:
             self.na.setup(start_freq=1e5,